@@ -1,23 +1,51 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Iterator
+import os
+import pickle
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from random import choice, shuffle
+from random import choice, choices, randrange, shuffle
+from types import MappingProxyType
 
 # Words file can be found here 
 DICTIONARY_PATH = Path(__file__).resolve().parent / "sowpods.txt"
+# Bump whenever the shape or contents of the cached maps change.
+_CACHE_FORMAT = 6
 
-_VOWELS = set("aeiou")
-_ANAGRAM_MAP: dict[str, list[str]] | None = None
+_VOWELS = frozenset("aeiou")
+_ANAGRAM_MAP: Mapping[bytes, tuple[str, ...]] | None = None
 _BUCKET_WORDS: dict[int, list[str]] | None = None
-_UNSOLVABLE_WORDS: dict[int, list[str]] | None = None
+# Per difficulty, all unsolvable words packed by _pack_words.
+_UNSOLVABLE_WORDS: dict[int, tuple[str, array[int]]] | None = None
 _MIN_LEN: int | None = None
 _MAX_LEN: int | None = None
 
 
-def _signature(s: str) -> str:
-    return "".join(sorted(s))
+@lru_cache(maxsize=8192)
+def _signature(s: str) -> bytes:
+    """Return the 26-byte letter-count signature of a lowercase a-z string.
+
+    Two words are anagrams exactly when their signatures are equal. Cached
+    because interactive sessions solve and verify the same puzzles repeatedly.
+    """
+    counts = [0] * 26
+    for ch in s:
+        counts[ord(ch) - 97] += 1
+    return bytes(counts)
+
+
+def _pack_words(words: Iterable[str]) -> tuple[str, array[int]]:
+    """Pack words into one string plus offsets; word i is
+    text[offsets[i] : offsets[i + 1]].
+
+    Avoids keeping a separate str object alive for every word.
+    """
+    words = list(words)
+    return "".join(words), array("L", accumulate(map(len, words), initial=0))
 
 
 def _load_words() -> list[str]:
@@ -27,13 +55,9 @@ def _load_words() -> list[str]:
             "This module requires sowpods.txt to be present."
         )
 
-    with DICTIONARY_PATH.open("r", encoding="utf-8") as f:
-        words = []
-        for line in f:
-            w = line.strip()
-            if not w:
-                continue
-            words.append(w.lower())
+    # One word per line; splitting the whole file on whitespace also strips
+    # line endings and skips blank lines without a per-line Python loop.
+    words = DICTIONARY_PATH.read_bytes().lower().decode("ascii").split()
     if not words:
         raise ValueError(f"Dictionary file is empty: {DICTIONARY_PATH}")
     return words
@@ -50,24 +74,93 @@ def _difficulty_for_length(length: int) -> int:
     return max(1, min(5, int(idx) + 1))
 
 
-def _init() -> None:
+def _cache_path() -> Path:
+    return DICTIONARY_PATH.with_suffix(".cache.pkl")
+
+
+def _dictionary_stamp() -> tuple[int, int, int] | None:
+    """Identify the dictionary contents (and cache layout) a cache was built from."""
+    try:
+        st = DICTIONARY_PATH.stat()
+    except OSError:
+        return None
+    return (_CACHE_FORMAT, st.st_mtime_ns, st.st_size)
+
+
+def _load_cache(stamp: tuple[int, int, int]) -> bool:
+    """Populate the module state from the on-disk cache if it matches `stamp`."""
     global _ANAGRAM_MAP, _BUCKET_WORDS, _UNSOLVABLE_WORDS, _MIN_LEN, _MAX_LEN
+    try:
+        with _cache_path().open("rb") as f:
+            cached_stamp, state = pickle.load(f)
+        if cached_stamp != stamp:
+            return False
+        min_len, max_len, anagram_map, bucket_words, unsolvable_words = state
+        anagram_map = MappingProxyType(anagram_map)
+    except Exception:
+        # Missing, truncated or otherwise unreadable caches are just rebuilt.
+        return False
+    _MIN_LEN = min_len
+    _MAX_LEN = max_len
+    _ANAGRAM_MAP = anagram_map
+    _BUCKET_WORDS = bucket_words
+    _UNSOLVABLE_WORDS = unsolvable_words
+    return True
+
+
+def _save_cache(stamp: tuple[int, int, int]) -> None:
+    """Write the module state to the on-disk cache, ignoring unwritable locations."""
+    assert _ANAGRAM_MAP is not None
+    # Mapping proxies cannot be pickled, so store a plain dict copy.
+    anagram_map = dict(_ANAGRAM_MAP)
+    state = (_MIN_LEN, _MAX_LEN, anagram_map, _BUCKET_WORDS, _UNSOLVABLE_WORDS)
+    path = _cache_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump((stamp, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _init() -> None:
     if _ANAGRAM_MAP is not None and _BUCKET_WORDS is not None:
         return
 
+    stamp = _dictionary_stamp()
+    if stamp is not None and _load_cache(stamp):
+        return
+    _build()
+    if stamp is not None:
+        _save_cache(stamp)
+
+
+def _build() -> None:
+    """Build all module state from the dictionary file."""
+    global _ANAGRAM_MAP, _BUCKET_WORDS, _UNSOLVABLE_WORDS, _MIN_LEN, _MAX_LEN
+
     words = _load_words()
     _MIN_LEN = min(len(w) for w in words)
     _MAX_LEN = max(len(w) for w in words)
 
-    anagram_map: dict[str, list[str]] = defaultdict(list)
+    anagram_map: dict[bytes, list[str]] = defaultdict(list)
     bucket_words: dict[int, list[str]] = defaultdict(list)
+    # Signatures parallel to bucket_words, reused by the unsolvable search.
+    bucket_sigs: dict[int, list[bytes]] = defaultdict(list)
 
+    difficulty_by_length = [0] * (_MAX_LEN + 1)
+    for length in range(_MIN_LEN, _MAX_LEN + 1):
+        difficulty_by_length[length] = _difficulty_for_length(length)
+
+    # Bypass the LRU cache so the build doesn't flush recent query signatures.
+    signature = _signature.__wrapped__
     for w in words:
-        sig = _signature(w)
+        sig = signature(w)
         anagram_map[sig].append(w)
-
-        d = _difficulty_for_length(len(w))
+        d = difficulty_by_length[len(w)]
         bucket_words[d].append(w)
+        bucket_sigs[d].append(sig)
 
     for d in range(1, 6):
         if bucket_words.get(d):
@@ -83,8 +176,13 @@ def _init() -> None:
         if nearest is None:
             raise RuntimeError("No words available to create difficulty buckets")
         bucket_words[d] = bucket_words[nearest]
+        bucket_sigs[d] = bucket_sigs[nearest]
 
-    _ANAGRAM_MAP = dict(anagram_map)
+    # The map is read-only once built: tuples let solve() hand out results
+    # without copying, and the proxy guards against accidental mutation.
+    _ANAGRAM_MAP = MappingProxyType(
+        {sig: tuple(ws) for sig, ws in anagram_map.items()}
+    )
     _BUCKET_WORDS = dict(bucket_words)
 
     # Pre-compute unsolvable words for each difficulty bucket.
@@ -92,14 +190,13 @@ def _init() -> None:
     # whose signature doesn't exist in the dictionary.
     unsolvable_words: dict[int, list[str]] = defaultdict(list)
     for d in range(1, 6):
-        for w in bucket_words[d]:
-            if not any(ch in _VOWELS for ch in w):
+        for w, sig in zip(bucket_words[d], bucket_sigs[d]):
+            if _VOWELS.isdisjoint(w):
                 continue
-            for mutated in _single_vowel_mutations(w):
-                if _signature(mutated) not in _ANAGRAM_MAP:
-                    unsolvable_words[d].append(mutated)
-                    break
-    _UNSOLVABLE_WORDS = dict(unsolvable_words)
+            mutated = _unsolvable_mutation(w, sig)
+            if mutated is not None:
+                unsolvable_words[d].append(mutated)
+    _UNSOLVABLE_WORDS = {d: _pack_words(unsolvable_words[d]) for d in range(1, 6)}
 
 
 def _validate_input(s: str, name: str) -> str:
@@ -112,15 +209,15 @@ def _validate_input(s: str, name: str) -> str:
     return normalized
 
 
-def solve(puzzle: str) -> list[str]:
+def solve(puzzle: str) -> Sequence[str]:
     """Return all valid English words that are anagrams of the puzzle string.
 
     Args:
         puzzle: A string of letters to find anagrams for.
 
     Returns:
-        A list of valid dictionary words that use exactly the same letters.
-        Returns an empty list if no anagrams exist.
+        A tuple of valid dictionary words that use exactly the same letters.
+        Returns an empty tuple if no anagrams exist.
 
     Raises:
         ValueError: If puzzle is empty or contains non-alphabetic characters.
@@ -128,8 +225,13 @@ def solve(puzzle: str) -> list[str]:
     _init()
     assert _ANAGRAM_MAP is not None
     puzzle_norm = _validate_input(puzzle, "puzzle")
+    assert _MAX_LEN is not None
+    # Signatures only count a-z, and nothing longer than the longest
+    # dictionary word can have solutions.
+    if not puzzle_norm.isascii() or len(puzzle_norm) > _MAX_LEN:
+        return ()
     sig = _signature(puzzle_norm)
-    return list(_ANAGRAM_MAP.get(sig, []))
+    return _ANAGRAM_MAP.get(sig, ())
 
 
 def verify(puzzle: str, answer: str) -> bool:
@@ -151,13 +253,19 @@ def verify(puzzle: str, answer: str) -> bool:
 
     puzzle_norm = _validate_input(puzzle, "puzzle")
     answer_norm = _validate_input(answer, "answer")
+    assert _MAX_LEN is not None
+    # Anagrams have equal lengths, so most wrong answers are rejected here
+    # without computing any signature.
+    if len(answer_norm) != len(puzzle_norm) or len(answer_norm) > _MAX_LEN:
+        return False
+    if not (puzzle_norm.isascii() and answer_norm.isascii()):
+        return False
 
-    puzzle_sig = _signature(puzzle_norm)
     answer_sig = _signature(answer_norm)
-    if puzzle_sig != answer_sig:
+    if answer_norm != puzzle_norm and _signature(puzzle_norm) != answer_sig:
         return False
 
-    return answer_norm in _ANAGRAM_MAP.get(puzzle_sig, [])
+    return answer_norm in _ANAGRAM_MAP.get(answer_sig, ())
 
 
 def generate_puzzle(difficulty: int | None = None, unsolvable: bool = False) -> str:
@@ -195,6 +303,55 @@ def generate_puzzle(difficulty: int | None = None, unsolvable: bool = False) ->
     return _generate_unsolvable_puzzle(difficulty)
 
 
+def generate_puzzles(
+    n: int, difficulty: int | None = None, unsolvable: bool = False
+) -> list[str]:
+    """Generate several anagram puzzles at once.
+
+    Equivalent to calling `generate_puzzle` n times. Base words are drawn
+    in batches, which mainly speeds up unsolvable puzzles; solvable ones
+    cost about the same as a loop.
+
+    Args:
+        n: How many puzzles to generate.
+        difficulty: An integer from 1 (easiest/shortest) to 5 (hardest/longest).
+            If None, each puzzle gets its own random difficulty.
+        unsolvable: If True, every puzzle has no valid solutions.
+
+    Returns:
+        A list of n scrambled strings.
+
+    Raises:
+        ValueError: If n is negative or difficulty is not an integer from 1 to 5.
+        RuntimeError: If unsolvable puzzles are requested for a difficulty
+            that has none.
+    """
+    _init()
+    assert _BUCKET_WORDS is not None
+
+    if n < 0:
+        raise ValueError("n must be a non-negative int")
+    if difficulty is not None and difficulty not in (1, 2, 3, 4, 5):
+        raise ValueError("difficulty must be an int from 1 to 5")
+
+    if difficulty is None:
+        per_difficulty = Counter(choices((1, 2, 3, 4, 5), k=n))
+    else:
+        per_difficulty = Counter({difficulty: n})
+
+    bases: list[str] = []
+    for d, k in per_difficulty.items():
+        if unsolvable:
+            bases.extend(_choose_unsolvables(d, k))
+        else:
+            bases.extend(choices(_BUCKET_WORDS[d], k=k))
+    # choices() already returns each difficulty's words in random order;
+    # only mixed difficulties need interleaving.
+    if len(per_difficulty) > 1:
+        shuffle(bases)
+    return [_shuffle_not_identity(base) for base in bases]
+
+
 def _shuffle_not_identity(word: str) -> str:
     """Shuffle letters to produce a different arrangement when possible.
 
@@ -210,18 +367,17 @@ def _shuffle_not_identity(word: str) -> str:
 
     # Fallback: if random shuffle accidentally returned the original word,
     # force a swap of two distinct characters to ensure a valid puzzle.
-    # We pick random indices to avoid deterministic patterns.
+    # Starting from a random index avoids deterministic patterns while
+    # keeping the scan linear.
     n = len(letters)
-    indices = list(range(n))
-    shuffle(indices)
-
-    for i in range(n - 1):
-        idx1 = indices[i]
-        for j in range(i + 1, n):
-            idx2 = indices[j]
-            if letters[idx1] != letters[idx2]:
-                letters[idx1], letters[idx2] = letters[idx2], letters[idx1]
-                return "".join(letters)
+    if n < 2:
+        return candidate
+    i = randrange(n)
+    for offset in range(1, n):
+        j = (i + offset) % n
+        if letters[j] != letters[i]:
+            letters[i], letters[j] = letters[j], letters[i]
+            return "".join(letters)
     return candidate
 
 
@@ -232,29 +388,53 @@ def _generate_unsolvable_puzzle(difficulty: int) -> str:
     single-vowel mutations of real words whose signatures don't exist
     in the dictionary.
     """
+    return _shuffle_not_identity(_choose_unsolvables(difficulty, 1)[0])
+
+
+def _choose_unsolvables(difficulty: int, k: int) -> list[str]:
+    """Draw k pre-computed unsolvable words, with replacement."""
     assert _UNSOLVABLE_WORDS is not None
 
-    unsolvables = _UNSOLVABLE_WORDS.get(difficulty, [])
-    if not unsolvables:
+    text, offsets = _UNSOLVABLE_WORDS[difficulty]
+    count = len(offsets) - 1
+    if not count:
         raise RuntimeError(
             f"No unsolvable puzzles available for difficulty {difficulty}"
         )
 
-    return _shuffle_not_identity(choice(unsolvables))
+    return [text[offsets[i] : offsets[i + 1]] for i in choices(range(count), k=k)]
 
 
-def _single_vowel_mutations(word: str) -> Iterator[str]:
-    """Yield all single-vowel substitutions of the given word."""
-    letters = list(word)
-    vowel_positions = [i for i, ch in enumerate(letters) if ch in _VOWELS]
-    for pos in vowel_positions:
-        current = letters[pos]
-        for v in "aeiou":
-            if v == current:
-                continue
-            mutated_letters = letters[:]
-            mutated_letters[pos] = v
-            yield "".join(mutated_letters)
+def _single_vowel_substitutions(word: str) -> Iterator[tuple[int, int, int]]:
+    """Yield (position, current vowel, replacement vowel) for every
+    single-vowel substitution of the given word, with vowels as ASCII codes.
+    """
+    for pos, current in enumerate(word.encode("ascii")):
+        if current not in b"aeiou":
+            continue
+        for v in b"aeiou":
+            if v != current:
+                yield pos, current, v
+
+
+def _unsolvable_mutation(word: str, sig: bytes) -> str | None:
+    """Return the first single-vowel mutation of a dictionary word that has
+    no anagram in the dictionary, or None if every mutation is solvable.
+
+    `sig` must be the word's signature.
+    """
+    assert _ANAGRAM_MAP is not None
+    # A substitution only changes two letter counts, so each candidate's
+    # signature is derived from the word's in O(1) instead of recounting.
+    counts = bytearray(sig)
+    for pos, current, v in _single_vowel_substitutions(word):
+        counts[current - 97] -= 1
+        counts[v - 97] += 1
+        if bytes(counts) not in _ANAGRAM_MAP:
+            return word[:pos] + chr(v) + word[pos + 1 :]
+        counts[current - 97] += 1
+        counts[v - 97] -= 1
+    return None
 
 
 if __name__ == "__main__":
@@ -1,9 +1,28 @@
+import pickle
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import anagram
 
 
 class TestAnagram(unittest.TestCase):
+    def setUp(self):
+        # Keep the on-disk cache out of the source tree.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = Path(tmp.name) / "sowpods.cache.pkl"
+        patcher = mock.patch.object(
+            anagram, "_cache_path", return_value=self.cache_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _reset_state(self):
+        anagram._ANAGRAM_MAP = None
+        anagram._BUCKET_WORDS = None
+
     def _pick_word(self, difficulty: int, predicate) -> str:
         anagram._init()
         words = anagram._BUCKET_WORDS[difficulty]
@@ -12,7 +31,7 @@ class TestAnagram(unittest.TestCase):
                 return w
         self.fail(f"No word found for difficulty={difficulty} matching predicate")
 
-    def _pick_signature(self, predicate) -> str:
+    def _pick_signature(self, predicate) -> bytes:
         anagram._init()
         for sig, words in anagram._ANAGRAM_MAP.items():
             if predicate(sig, words):
@@ -28,7 +47,7 @@ class TestAnagram(unittest.TestCase):
     def test_solve_returns_empty_for_unsolvable(self):
         # Use generator to ensure we pick something with zero solutions.
         p = anagram.generate_puzzle(difficulty=3, unsolvable=True)
-        self.assertEqual(anagram.solve(p), [])
+        self.assertEqual(anagram.solve(p), ())
 
     def test_verify_true_for_valid_solution(self):
         sols = anagram.solve("dgo")
@@ -37,6 +56,14 @@ class TestAnagram(unittest.TestCase):
     def test_verify_false_for_invalid_solution(self):
         self.assertFalse(anagram.verify("dgo", "cat"))
 
+    def test_verify_false_for_different_length_answer(self):
+        self.assertFalse(anagram.verify("dgoo", "dog"))
+        self.assertFalse(anagram.verify("dgo", "dogs"))
+
+    def test_verify_answer_identical_to_puzzle(self):
+        self.assertTrue(anagram.verify("dog", "dog"))
+        self.assertFalse(anagram.verify("dgo", "dgo"))
+
     def test_generate_puzzle_returns_string(self):
         p = anagram.generate_puzzle(difficulty=1)
         self.assertIsInstance(p, str)
@@ -48,6 +75,26 @@ class TestAnagram(unittest.TestCase):
         self.assertIsInstance(p, str)
         self.assertGreater(len(p), 0)
 
+    def test_generate_puzzles_returns_n_puzzles_of_difficulty(self):
+        anagram._init()
+        lengths = {len(w) for w in anagram._BUCKET_WORDS[4]}
+        puzzles = anagram.generate_puzzles(50, difficulty=4)
+        self.assertEqual(len(puzzles), 50)
+        for p in puzzles:
+            self.assertIn(len(p), lengths)
+            self.assertGreaterEqual(len(anagram.solve(p)), 1)
+
+    def test_generate_puzzles_unsolvable_have_no_solutions(self):
+        for p in anagram.generate_puzzles(50, unsolvable=True):
+            self.assertEqual(anagram.solve(p), ())
+
+    def test_generate_puzzles_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            anagram.generate_puzzles(-1)
+        with self.assertRaises(ValueError):
+            anagram.generate_puzzles(3, difficulty=6)
+        self.assertEqual(anagram.generate_puzzles(0), [])
+
     def test_shuffle_not_identity_when_possible(self):
         # Directly test helper: for a word with at least 2 distinct letters,
         # we should never get the same word back.
@@ -55,6 +102,16 @@ class TestAnagram(unittest.TestCase):
         self.assertNotEqual(s, "ab")
         self.assertCountEqual(list(s), list("ab"))
 
+    def test_shuffle_not_identity_fallback_swaps_distinct_letters(self):
+        # Force the fallback path by making the initial shuffle a no-op.
+        with mock.patch.object(anagram, "shuffle", lambda _letters: None):
+            for _ in range(20):
+                s = anagram._shuffle_not_identity("aaaab")
+                self.assertNotEqual(s, "aaaab")
+                self.assertCountEqual(s, "aaaab")
+            self.assertEqual(anagram._shuffle_not_identity("aaa"), "aaa")
+            self.assertEqual(anagram._shuffle_not_identity(""), "")
+
     def test_generate_solvable_has_at_least_one_solution(self):
         p = anagram.generate_puzzle(difficulty=2, unsolvable=False)
         self.assertGreaterEqual(len(anagram.solve(p)), 1)
@@ -68,7 +125,17 @@ class TestAnagram(unittest.TestCase):
 
     def test_generate_hard_unsolvable_has_no_solutions(self):
         puzzle = anagram.generate_puzzle(difficulty=5, unsolvable=True)
-        self.assertEqual(anagram.solve(puzzle), [])
+        self.assertEqual(anagram.solve(puzzle), ())
+
+    def test_unsolvable_pool_vowels_are_not_skewed(self):
+        # Unsolvable puzzles should look like real words, so no vowel may be
+        # strongly over-represented compared with the dictionary.
+        anagram._init()
+        real = "".join(w for ws in anagram._ANAGRAM_MAP.values() for w in ws)
+        pool = "".join(anagram._UNSOLVABLE_WORDS[d][0] for d in range(1, 6))
+        for v in "aeiou":
+            ratio = (pool.count(v) / len(pool)) / (real.count(v) / len(real))
+            self.assertLess(ratio, 2.0, f"vowel {v!r} is over-represented")
 
     def test_repeated_letter_word_still_solves(self):
         # Pick a word in the hardest bucket that has repeated letters.
@@ -86,6 +153,55 @@ class TestAnagram(unittest.TestCase):
         sols = anagram.solve(puzzle)
         self.assertGreaterEqual(len(sols), 2)
 
+    def test_init_reuses_on_disk_cache(self):
+        anagram._init()
+        anagram._save_cache(anagram._dictionary_stamp())
+        self.assertTrue(self.cache_path.exists())
+        built_map = anagram._ANAGRAM_MAP
+        built_unsolvable = anagram._UNSOLVABLE_WORDS
+
+        self._reset_state()
+        with mock.patch.object(anagram, "_build", side_effect=AssertionError):
+            anagram._init()
+        self.assertEqual(anagram._ANAGRAM_MAP, built_map)
+        self.assertEqual(anagram._UNSOLVABLE_WORDS, built_unsolvable)
+
+    def test_anagram_map_is_read_only(self):
+        anagram._init()
+        with self.assertRaises(TypeError):
+            anagram._ANAGRAM_MAP[b"\x00" * 26] = ("nope",)
+
+    def test_init_ignores_stale_cache(self):
+        anagram._init()
+        anagram._save_cache(anagram._dictionary_stamp())
+        self._reset_state()
+        with mock.patch.object(anagram, "_CACHE_FORMAT", -1), mock.patch.object(
+            anagram, "_save_cache"
+        ), mock.patch.object(anagram, "_build", wraps=anagram._build) as build:
+            anagram._init()
+        build.assert_called_once()
+
+    def test_init_rebuilds_on_malformed_cache(self):
+        anagram._init()
+        with self.cache_path.open("wb") as f:
+            pickle.dump((anagram._dictionary_stamp(), ("wrong", "shape")), f)
+        self._reset_state()
+        with mock.patch.object(anagram, "_save_cache"), mock.patch.object(
+            anagram, "_build", wraps=anagram._build
+        ) as build:
+            anagram._init()
+        build.assert_called_once()
+        self.assertIn("dog", anagram.solve("dgo"))
+
+    def test_init_works_without_writable_cache(self):
+        anagram._init()
+        self._reset_state()
+        unwritable = self.cache_path.parent / "missing-dir" / "sowpods.cache.pkl"
+        with mock.patch.object(anagram, "_cache_path", return_value=unwritable):
+            anagram._init()
+        self.assertFalse(unwritable.exists())
+        self.assertIn("dog", anagram.solve("dgo"))
+
     def test_solve_raises_on_empty_input(self):
         with self.assertRaises(ValueError) as ctx:
             anagram.solve("")
@@ -96,6 +212,15 @@ class TestAnagram(unittest.TestCase):
             anagram.solve("d-o-g")
         self.assertIn("alphabetic", str(ctx.exception))
 
+    def test_non_ascii_input_has_no_solutions(self):
+        self.assertEqual(anagram.solve("caf\u00e9"), ())
+        self.assertFalse(anagram.verify("caf\u00e9", "face"))
+        self.assertFalse(anagram.verify("face", "caf\u00e9"))
+
+    def test_solve_returns_empty_for_overlong_input(self):
+        # Longer than any dictionary word (and than a signature byte can count).
+        self.assertEqual(anagram.solve("a" * 300), ())
+
     def test_verify_raises_on_empty_answer(self):
         with self.assertRaises(ValueError) as ctx:
             anagram.verify("dog", "")